@@ -7,32 +7,374 @@ Integrates agents from the Agent Template Package
 import os
 import sys
 import yaml
+import hashlib
+import importlib.util
 import json
+import mmap
+import py_compile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 from typing import Dict, List, Any
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 # Paths
 CLOUDFLAIR_ROOT = Path(__file__).parent.parent
 AGENT_TEMPLATE_PATH = Path(r"C:\Users\Mrdru\OneDrive\Documents\Projects\AI_Projects\AGENT_TEMPLATE_PACKAGE")
+_TEMPLATE_ROOT = os.fspath(AGENT_TEMPLATE_PATH)
 AGENTS_CONFIG = CLOUDFLAIR_ROOT / "agents.config.yaml"
 
+# Files at least this large are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 16 * 1024
+
+
+def _index_playbooks(root: str) -> Dict[str, List[str]]:
+    """Map each agent directory under root to the YAML playbooks it holds"""
+    index = {}
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        if dirpath == root:
+            for name in dirnames:
+                index[name] = []
+            continue
+        # Only the files directly inside each agent directory count
+        dirnames[:] = []
+        index[os.path.basename(dirpath)] = [
+            os.path.join(dirpath, name) for name in filenames if name.endswith(".yaml")
+        ]
+    return index
+
+
+def _yaml_load_path(path):
+    """Load a YAML file, memory-mapping it once it is large enough to matter"""
+    path = os.fspath(path)
+    if os.path.getsize(path) < _MMAP_THRESHOLD:
+        # Binary file objects skip the decode layer and keep f.name for errors
+        with open(path, 'rb') as f:
+            return yaml.load(f, Loader=_Loader)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        try:
+            return yaml.load(mm, Loader=_Loader)
+        except yaml.MarkedYAMLError as e:
+            # The mmap has no name; point the marks back at the file
+            def named(mark):
+                return mark and yaml.Mark(path, mark.index, mark.line, mark.column, None, None)
+            raise type(e)(e.context, named(e.context_mark), e.problem, named(e.problem_mark), e.note) from None
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"{path}: {e}") from e
+
+
+def _parse_one(path):
+    """Parse a single YAML file, returning it alongside its path"""
+    return path, _yaml_load_path(path)
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds identical bytes"""
+    new = content.encode("utf-8")
+    digest = hashlib.blake2b(new, digest_size=16).digest()
+    if path.exists() and hashlib.blake2b(path.read_bytes(), digest_size=16).digest() == digest:
+        return False
+    path.write_bytes(new)
+    return True
+
+
+def _write_module(path: Path, content: str) -> bool:
+    """Write a generated module and keep its hash-checked bytecode current"""
+    changed = _write_if_changed(path, content)
+    cfile = importlib.util.cache_from_source(os.fspath(path))
+    if changed or not os.path.exists(cfile):
+        py_compile.compile(
+            os.fspath(path),
+            cfile=cfile,
+            doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+        )
+    return changed
+
+
+# Source of the generated playbook adapters, compiled once at import.
+# Placeholders use string.Template syntax so the body stays plain Python.
+# The shared logic is written once to playbook_adapter_base.py; each agent
+# only gets a small subclass that fills in its class attributes.
+_BASE_ADAPTER_TEMPLATE = Template('''"""
+Shared Playbook Adapter base class
+Auto-generated from Agent Template Package
+"""
+
+import hashlib
+import hmac
+import json
+import mmap
+import os
+import sys
+import threading
+import time
+import requests
+import yaml
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Request bodies are signed as bytes, which orjson returns directly
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to JSON bytes, accepting everything json.dumps does"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+_MMAP_THRESHOLD = 16 * 1024
+_MAX_SYNC_WORKERS = 8
+
+def _yaml_load_path(path):
+    """Load a YAML file, memory-mapping it once it is large enough to matter"""
+    path = os.fspath(path)
+    if os.path.getsize(path) < _MMAP_THRESHOLD:
+        # Binary file objects skip the decode layer and keep f.name for errors
+        with open(path, 'rb') as f:
+            return yaml.load(f, Loader=_Loader)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        try:
+            return yaml.load(mm, Loader=_Loader)
+        except yaml.MarkedYAMLError as e:
+            # The mmap has no name; point the marks back at the file
+            def named(mark):
+                return mark and yaml.Mark(path, mark.index, mark.line, mark.column, None, None)
+            raise type(e)(e.context, named(e.context_mark), e.problem, named(e.problem_mark), e.note) from None
+        except yaml.YAMLError as e:
+            raise yaml.YAMLError(f"{path}: {e}") from e
+
+def _parse_one(path):
+    """Parse a single YAML file, returning it alongside its path"""
+    return path, _yaml_load_path(path)
+
+# Template package location; override to relocate without re-provisioning
+TEMPLATE_ROOT = os.environ.get("AGENT_TEMPLATE_ROOT", r"${template_root}")
+
+# Add template package to path
+sys.path.insert(0, TEMPLATE_ROOT)
+
+from service.playbook_engine import PlaybookEngine
+from service.agent_runtime import AgentRuntime
+
+class BasePlaybookAdapter:
+    """Adapter to execute template playbooks via CloudFlair"""
+    
+    # Set by each generated agent adapter
+    AGENT_NAME = ""
+    TEMPLATE_NAME = ""
+    CONFIG_FILE = ""
+    
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self.agent_name = self.AGENT_NAME
+        self._hmac_key = api_key.encode("utf-8")
+        self._agent_name_b = self.agent_name.encode("utf-8")
+        self._local = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        self._sync_executor = None
+        self.template_path = Path(TEMPLATE_ROOT, "agents")
+        self.playbook_engine = PlaybookEngine()
+        
+        # Load agent configuration
+        self.agent_config = _yaml_load_path(os.path.join(TEMPLATE_ROOT, "agents", self.CONFIG_FILE))
+        
+        # Initialize runtime
+        self.runtime = AgentRuntime(self.agent_config)
+        
+        # Parse each playbook once; every file is listed, the first file
+        # for each id is the one executed
+        self._playbooks = []
+        self._playbook_index = {}
+        playbook_dir = os.path.join(TEMPLATE_ROOT, "playbooks", "individual", self.TEMPLATE_NAME)
+        
+        if os.path.isdir(playbook_dir):
+            paths = [
+                entry.path
+                for entry in os.scandir(playbook_dir)
+                if entry.is_file() and entry.name.endswith(".yaml")
+            ]
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(32, len(paths))) as ex:
+                    for pb_path, pb_data in ex.map(_parse_one, sorted(paths)):
+                        pb_data = pb_data or {}
+                        pb_id = pb_data.get("id")
+                        self._playbooks.append((pb_data, pb_path))
+                        if pb_id is None:
+                            print(f"⚠️ Playbook {pb_path} has no id and cannot be executed")
+                        elif pb_id in self._playbook_index:
+                            print(f"⚠️ Playbook {pb_path} duplicates id {pb_id}; "
+                                  f"using {self._playbook_index[pb_id][1]}")
+                        else:
+                            self._playbook_index[pb_id] = (pb_data, pb_path)
+    
+    def list_playbooks(self) -> list:
+        """List available playbooks for this agent"""
+        return [
+            {
+                "id": pb_data.get("id"),
+                "name": pb_data.get("name"),
+                "description": pb_data.get("description"),
+                "file": os.path.basename(pb_path),
+            }
+            for pb_data, pb_path in self._playbooks
+        ]
+    
+    def execute_playbook(self, playbook_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a specific playbook"""
+        if playbook_id not in self._playbook_index:
+            raise ValueError(f"Playbook {playbook_id} not found")
+        
+        pb_data, _ = self._playbook_index[playbook_id]
+        
+        # Execute via engine
+        result = self.playbook_engine.execute(pb_data, context)
+        
+        # Send result to CloudFlair
+        self._sync_to_cloudflair(playbook_id, result)
+        
+        return result
+    
+    def execute_playbooks(self, jobs: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Execute several playbooks, syncing all results to CloudFlair concurrently"""
+        for playbook_id, _ in jobs:
+            if playbook_id not in self._playbook_index:
+                raise ValueError(f"Playbook {playbook_id} not found")
+        
+        # Workers, and their sessions, persist across batches
+        if self._sync_executor is None:
+            self._sync_executor = ThreadPoolExecutor(max_workers=_MAX_SYNC_WORKERS)
+        
+        results = []
+        syncs = []
+        try:
+            for playbook_id, context in jobs:
+                # Execute via engine
+                result = self.playbook_engine.execute(self._playbook_index[playbook_id][0], context)
+                results.append(result)
+                
+                # Sync while the next job runs
+                syncs.append(self._sync_executor.submit(self._post_result, playbook_id, result))
+        finally:
+            # Jobs that ran are synced even if a later one raised;
+            # outcomes are reported in job order
+            for sync in syncs:
+                print(sync.result())
+        
+        return results
+    
+    def close(self):
+        """Stop the sync workers and close every HTTP session"""
+        if self._sync_executor is not None:
+            self._sync_executor.shutdown(wait=True)
+            self._sync_executor = None
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self._local = threading.local()
+    
+    def _get_session(self) -> requests.Session:
+        """Return this thread's HTTP session, creating it on first use"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def _sync_to_cloudflair(self, playbook_id: str, result: Dict[str, Any]):
+        """Sync playbook execution results to CloudFlair API"""
+        print(self._post_result(playbook_id, result))
+    
+    def _post_result(self, playbook_id: str, result: Dict[str, Any]) -> str:
+        """Post one playbook result to CloudFlair, returning a status line"""
+        url = "https://api.cloudflair.com/agent/tasks"
+        
+        try:
+            # Prepare request
+            body = _dumps({
+                "type": "playbook_execution",
+                "payload": {
+                    "playbook_id": playbook_id,
+                    "result": result,
+                    "agent": self.agent_name,
+                }
+            })
+            
+            timestamp = int(time.time())
+            message = b"%s:%d:%s" % (self._agent_name_b, timestamp, body)
+            signature = hmac.new(self._hmac_key, message, hashlib.sha256).hexdigest()
+            
+            headers = {
+                "Content-Type": "application/json",
+                "X-Agent-Id": self.agent_name,
+                "X-Timestamp": str(timestamp),
+                "X-Signature": signature,
+            }
+            
+            response = self._get_session().post(url, data=body, headers=headers)
+            response.raise_for_status()
+            return f"✓ Synced to CloudFlair: {response.json()}"
+        except Exception as e:
+            return f"⚠️ Failed to sync to CloudFlair: {e}"
+''')
+
+_ADAPTER_TEMPLATE = Template('''"""
+Playbook Adapter for ${cloudflair_name}
+Auto-generated from Agent Template Package
+"""
+
+from playbook_adapter_base import BasePlaybookAdapter
+
+class ${cloudflair_name}Adapter(BasePlaybookAdapter):
+    """Adapter to execute ${template_name} playbooks via CloudFlair"""
+    
+    AGENT_NAME = "${cloudflair_name}"
+    TEMPLATE_NAME = "${template_name}"
+    CONFIG_FILE = "${config_file}"
+
+# Available playbooks for this agent
+AVAILABLE_PLAYBOOKS = ${playbook_count}
+''')
+
+
 class AgentProvisioner:
     def __init__(self):
         self.cloudflair_config = self.load_cloudflair_config()
         self.template_agents = self.discover_template_agents()
+        # Walk the playbook tree once for both the adapters and the docs
+        self._playbook_index = _index_playbooks(os.path.join(_TEMPLATE_ROOT, "playbooks", "individual"))
         
     def load_cloudflair_config(self) -> Dict[str, Any]:
         """Load CloudFlair agent configuration"""
-        with open(AGENTS_CONFIG, 'r') as f:
-            return yaml.safe_load(f)
+        return _yaml_load_path(AGENTS_CONFIG)
     
     def discover_template_agents(self) -> List[Dict[str, Any]]:
         """Discover available agents from template package"""
         agents = []
-        agents_dir = AGENT_TEMPLATE_PATH / "agents"
+        agents_dir = os.path.join(_TEMPLATE_ROOT, "agents")
         
-        if not agents_dir.exists():
+        if not os.path.isdir(agents_dir):
             print(f"❌ Agent Template Package not found at {AGENT_TEMPLATE_PATH}")
             sys.exit(1)
         
@@ -47,18 +389,26 @@ class AgentProvisioner:
             "cs.agent.yaml": "CommunityAgent",
         }
         
+        found = []
         for template_file, cloudflair_name in agent_mapping.items():
-            agent_path = agents_dir / template_file
-            if agent_path.exists():
-                with open(agent_path, 'r') as f:
-                    agent_config = yaml.safe_load(f)
-                    agents.append({
-                        "template_name": template_file.replace(".agent.yaml", ""),
-                        "cloudflair_name": cloudflair_name,
-                        "config": agent_config,
-                        "path": agent_path,
-                    })
-                    print(f"✓ Found template agent: {template_file}")
+            agent_path = os.path.join(agents_dir, template_file)
+            if os.path.exists(agent_path):
+                found.append((template_file, cloudflair_name, agent_path))
+        if not found:
+            return agents
+        
+        # Parse agent configs concurrently; map() keeps mapping order
+        with ThreadPoolExecutor(max_workers=min(32, len(found))) as ex:
+            results = list(ex.map(_parse_one, [agent_path for _, _, agent_path in found]))
+        
+        for (template_file, cloudflair_name, agent_path), (_, agent_config) in zip(found, results):
+            agents.append({
+                "template_name": template_file.replace(".agent.yaml", ""),
+                "cloudflair_name": cloudflair_name,
+                "config": agent_config,
+                "path": agent_path,
+            })
+            print(f"✓ Found template agent: {template_file}")
         
         return agents
     
@@ -69,141 +419,37 @@ class AgentProvisioner:
         
         print("\n📚 Generating playbook adapters...")
         
-        # Map playbook directories
-        playbooks_dir = AGENT_TEMPLATE_PATH / "playbooks" / "individual"
+        # Shared base class; left alone when unchanged
+        base_path = adapters_dir / "playbook_adapter_base.py"
+        if _write_module(base_path, self.generate_base_adapter_code()):
+            print(f"  ✎ Updated {base_path.name}")
         
         for agent in self.template_agents:
-            agent_playbooks_dir = playbooks_dir / agent["template_name"]
-            if not agent_playbooks_dir.exists():
+            # Agents without a playbook directory get no adapter
+            playbook_files = self._playbook_index.get(agent["template_name"])
+            if playbook_files is None:
                 continue
             
-            # Count available playbooks
-            playbook_files = list(agent_playbooks_dir.glob("*.yaml"))
             print(f"  {agent['cloudflair_name']}: {len(playbook_files)} playbooks available")
             
             # Generate adapter
             adapter_content = self.generate_adapter_code(agent, playbook_files)
             adapter_path = adapters_dir / f"{agent['cloudflair_name'].lower()}_adapter.py"
-            
-            with open(adapter_path, 'w') as f:
-                f.write(adapter_content)
+            if _write_module(adapter_path, adapter_content):
+                print(f"  ✎ Updated {adapter_path.name}")
     
-    def generate_adapter_code(self, agent: Dict, playbooks: List[Path]) -> str:
-        """Generate Python adapter code for an agent"""
-        return f'''"""
-Playbook Adapter for {agent['cloudflair_name']}
-Auto-generated from Agent Template Package
-"""
-
-import os
-import sys
-import yaml
-from pathlib import Path
-from typing import Dict, Any, Optional
-
-# Add template package to path
-sys.path.insert(0, r"{AGENT_TEMPLATE_PATH}")
-
-from service.playbook_engine import PlaybookEngine
-from service.agent_runtime import AgentRuntime
-
-class {agent['cloudflair_name']}Adapter:
-    """Adapter to execute {agent['template_name']} playbooks via CloudFlair"""
+    def generate_base_adapter_code(self) -> str:
+        """Generate the shared base class for all agent adapters"""
+        return _BASE_ADAPTER_TEMPLATE.substitute(template_root=_TEMPLATE_ROOT)
     
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.agent_name = "{agent['cloudflair_name']}"
-        self.template_path = Path(r"{agent['path'].parent}")
-        self.playbook_engine = PlaybookEngine()
-        
-        # Load agent configuration
-        with open(r"{agent['path']}", 'r') as f:
-            self.agent_config = yaml.safe_load(f)
-        
-        # Initialize runtime
-        self.runtime = AgentRuntime(self.agent_config)
-    
-    def list_playbooks(self) -> list:
-        """List available playbooks for this agent"""
-        playbooks = []
-        playbook_dir = self.template_path / "playbooks" / "individual" / "{agent['template_name']}"
-        
-        if playbook_dir.exists():
-            for pb_file in playbook_dir.glob("*.yaml"):
-                with open(pb_file, 'r') as f:
-                    pb_data = yaml.safe_load(f)
-                    playbooks.append({{
-                        "id": pb_data.get("id"),
-                        "name": pb_data.get("name"),
-                        "description": pb_data.get("description"),
-                        "file": pb_file.name,
-                    }})
-        
-        return playbooks
-    
-    def execute_playbook(self, playbook_id: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a specific playbook"""
-        # Find playbook file
-        playbook_dir = self.template_path / "playbooks" / "individual" / "{agent['template_name']}"
-        
-        for pb_file in playbook_dir.glob("*.yaml"):
-            with open(pb_file, 'r') as f:
-                pb_data = yaml.safe_load(f)
-                if pb_data.get("id") == playbook_id:
-                    # Execute via engine
-                    result = self.playbook_engine.execute(pb_data, context)
-                    
-                    # Send result to CloudFlair
-                    self._sync_to_cloudflair(playbook_id, result)
-                    
-                    return result
-        
-        raise ValueError(f"Playbook {{playbook_id}} not found")
-    
-    def _sync_to_cloudflair(self, playbook_id: str, result: Dict[str, Any]):
-        """Sync playbook execution results to CloudFlair API"""
-        import requests
-        import time
-        import hmac
-        import hashlib
-        import json
-        
-        # Prepare request
-        url = "https://api.cloudflair.com/agent/tasks"
-        body = json.dumps({{
-            "type": "playbook_execution",
-            "payload": {{
-                "playbook_id": playbook_id,
-                "result": result,
-                "agent": self.agent_name,
-            }}
-        }})
-        
-        timestamp = str(int(time.time()))
-        message = f"{{self.agent_name}}:{{timestamp}}:{{body}}"
-        signature = hmac.new(
-            self.api_key.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        
-        headers = {{
-            "Content-Type": "application/json",
-            "X-Agent-Id": self.agent_name,
-            "X-Timestamp": timestamp,
-            "X-Signature": signature,
-        }}
-        
-        try:
-            response = requests.post(url, data=body, headers=headers)
-            response.raise_for_status()
-            print(f"✓ Synced to CloudFlair: {{response.json()}}")
-        except Exception as e:
-            print(f"⚠️ Failed to sync to CloudFlair: {{e}}")
-
-# Available playbooks for this agent
-AVAILABLE_PLAYBOOKS = {len(playbooks)}
-'''
+    def generate_adapter_code(self, agent: Dict, playbooks: List[str]) -> str:
+        """Generate Python adapter code for an agent"""
+        return _ADAPTER_TEMPLATE.substitute(
+            cloudflair_name=agent["cloudflair_name"],
+            template_name=agent["template_name"],
+            config_file=os.path.basename(agent["path"]),
+            playbook_count=len(playbooks),
+        )
     
     def generate_integration_docs(self):
         """Generate documentation for the integration"""
@@ -220,18 +466,27 @@ Total agents integrated: {len(self.template_agents)}
 |---------------|------------------|--------------|-----------|
 """
         
-        playbooks_dir = AGENT_TEMPLATE_PATH / "playbooks" / "individual"
+        rows = []
         
-        for agent in self.template_agents:
-            agent_playbooks_dir = playbooks_dir / agent["template_name"]
-            playbook_count = len(list(agent_playbooks_dir.glob("*.yaml"))) if agent_playbooks_dir.exists() else 0
+        # Capability keys holding lists, found once across all agents. Keys
+        # that are lists for some agents but not others keep the type check.
+        all_caps = [agent["config"].get("capabilities", {}) for agent in self.template_agents]
+        list_keys = {k for caps in all_caps for k, v in caps.items() if isinstance(v, list)}
+        mixed_keys = {k for caps in all_caps for k, v in caps.items() if k in list_keys and not isinstance(v, list)}
+        list_keys -= mixed_keys
+        
+        for agent, capabilities in zip(self.template_agents, all_caps):
+            playbook_count = len(self._playbook_index.get(agent["template_name"], []))
             
-            capabilities = agent["config"].get("capabilities", {})
-            cap_count = sum(len(v) for v in capabilities.values() if isinstance(v, list))
+            cap_count = sum(len(capabilities[k]) for k in list_keys if k in capabilities)
+            cap_count += sum(
+                len(capabilities[k]) for k in mixed_keys
+                if isinstance(capabilities.get(k), list)
+            )
             
-            docs_content += f"| {agent['template_name']} | {agent['cloudflair_name']} | {cap_count} | {playbook_count} |\n"
+            rows.append(f"| {agent['template_name']} | {agent['cloudflair_name']} | {cap_count} | {playbook_count} |\n")
         
-        docs_content += f"""
+        docs_content += "".join(rows) + f"""
 
 ## Agent Template Package Location
 ```
@@ -242,7 +497,11 @@ Total agents integrated: {len(self.template_agents)}
 
 ### Python Example
 ```python
-from agents.playbook_adapters.content_adapter import ContentAgentAdapter
+import sys
+# Adapters import playbook_adapter_base from this same directory
+sys.path.insert(0, "agents/playbook-adapters")
+
+from contentagent_adapter import ContentAgentAdapter
 
 # Initialize adapter
 adapter = ContentAgentAdapter(api_key="your-key")
@@ -370,10 +629,8 @@ logging.basicConfig(level=logging.DEBUG)
         docs_path = CLOUDFLAIR_ROOT / "docs" / "agent-integration.md"
         docs_path.parent.mkdir(exist_ok=True)
         
-        with open(docs_path, 'w') as f:
-            f.write(docs_content)
-        
-        print(f"\n📝 Documentation generated: {docs_path}")
+        if _write_if_changed(docs_path, docs_content):
+            print(f"\n📝 Documentation generated: {docs_path}")
     
     def run(self):
         """Run the provisioning process"""
@@ -384,6 +641,10 @@ logging.basicConfig(level=logging.DEBUG)
         print(f"\n📁 CloudFlair root: {CLOUDFLAIR_ROOT}")
         print(f"📦 Template package: {AGENT_TEMPLATE_PATH}")
         
+        if not yaml.__with_libyaml__:
+            print("\n⚠️ PyYAML is running without libyaml; parsing will be slow")
+            print("   Reinstall PyYAML against libyaml to enable CSafeLoader")
+        
         if not AGENT_TEMPLATE_PATH.exists():
             print(f"\n❌ Agent Template Package not found at:")
             print(f"   {AGENT_TEMPLATE_PATH}")